@@ -6,15 +6,22 @@ API in an easier way.
 """
 
 from aliexpress_api.errors.exceptions import CategoriesNotFoudException
-from aliexpress_api.helpers.categories import filter_child_categories, filter_parent_categories
+from aliexpress_api.helpers.categories import index_categories
 from aliexpress_api.models.category import ChildCategory
-from .skd import setDefaultAppInfo
+from .skd import appinfo, setDefaultAppInfo
 from .skd import api as aliapi
 from .errors import ProductsNotFoudException, InvalidTrackingIdException, OrdersNotFoundException
-from .helpers import api_request, parse_products, get_list_as_string, get_product_ids
+from .helpers import api_request, parse_products, iter_products, get_list_as_string, get_product_ids, get_product_ids_as_string
+from .helpers import ResponseCache, get_request_cache_key, get_delivery_days_as_string
 from . import models
 
-from typing import List, Union
+import asyncio
+import copy
+import functools
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Union
 
 
 class AliexpressApi:
@@ -26,6 +33,13 @@ class AliexpressApi:
         language (str): Language code. Defaults to EN.
         currency (str): Currency code. Defaults to USD.
         tracking_id (str): The tracking id for link generator. Defaults to None.
+        cache_ttl (int): Seconds to keep categories and hot products responses in memory.
+            Repeated requests with the same parameters are answered from memory with a deep copy
+            of the stored response, products and categories included. Defaults to None, which
+            disables the cache.
+
+    The API keeps its HTTP connections alive between requests. Call ``close()`` or use
+    it as a context manager to release them when done.
     """
 
     def __init__(self,
@@ -35,6 +49,7 @@ class AliexpressApi:
         currency: models.Currency,
         tracking_id: str = None,
         app_signature: str = None,
+        cache_ttl: int = None,
         **kwargs):
         self._key = key
         self._secret = secret
@@ -43,13 +58,33 @@ class AliexpressApi:
         self._currency = currency
         self._app_signature = app_signature
         self.categories = None
+        self._categories_lock = threading.Lock()
+        self._categories_index = None
+        self._pool = aliapi.ConnectionPool()
+        self._response_cache = ResponseCache(cache_ttl) if cache_ttl else None
         setDefaultAppInfo(self._key, self._secret)
 
+        self._app_info = appinfo(self._key, self._secret)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def close(self):
+        """Closes the HTTP connections kept alive by this instance."""
+        self._pool.close()
+
 
     def get_products_details(self,
         product_ids: Union[str, List[str]],
         fields: Union[str, List[str]] = None,
         country: str = None,
+        raw: bool = False,
         **kwargs) -> List[models.Product]:
         """Get products information.
 
@@ -58,6 +93,8 @@ class AliexpressApi:
             fields (``str | list[str]``): The fields to include in the results. Defaults to all.
             country (``str``): Filter products that can be sent to that country. Returns the price
                 according to the country's tax rate policy.
+            raw (``bool``): If True, products are returned as received from the API, without
+                parsing them. Defaults to False.
 
         Returns:
             ``list[models.Product]``: A list of products.
@@ -68,27 +105,89 @@ class AliexpressApi:
             ``ApiRequestException``
             ``ApiRequestResponseException``
         """
-        product_ids = get_product_ids(product_ids)
-        product_ids = get_list_as_string(product_ids)
-
         request = aliapi.rest.AliexpressAffiliateProductdetailGetRequest()
+        request.set_app_info(self._app_info)
         request.app_signature = self._app_signature
         request.fields = get_list_as_string(fields)
-        request.product_ids = product_ids
+        request.product_ids = get_product_ids_as_string(product_ids)
         request.country = country
         request.target_currency = self._currency
         request.target_language = self._language
         request.tracking_id = self._tracking_id
 
-        response = api_request(request, 'aliexpress_affiliate_productdetail_get_response')
+        response = api_request(request, 'aliexpress_affiliate_productdetail_get_response', self._pool)
 
         if response.current_record_count > 0:
+            if raw:
+                return response.products.product
             response = parse_products(response.products.product)
             return response
         else:
             raise ProductsNotFoudException('No products found with current parameters')
 
 
+    async def aget_products_details_batched(self,
+        product_ids: Union[str, List[str]],
+        fields: Union[str, List[str]] = None,
+        country: str = None,
+        chunk_size: int = 50,
+        max_concurrency: int = 8,
+        **kwargs) -> List[models.Product]:
+        """Get products information for any number of products, splitting them in chunks
+        that are requested concurrently.
+
+        Args:
+            product_ids (``str | list[str]``): One or more links or product IDs.
+            fields (``str | list[str]``): The fields to include in the results. Defaults to all.
+            country (``str``): Filter products that can be sent to that country. Returns the price
+                according to the country's tax rate policy.
+            chunk_size (``int``): Maximum number of products on each request. Defaults to 50.
+            max_concurrency (``int``): Maximum number of requests running at the same time.
+                Defaults to 8.
+
+        Returns:
+            ``list[models.Product]``: A list of products, in the same order as the chunks.
+
+        Raises:
+            ``ProductsNotFoudException``
+            ``InvalidArgumentException``
+            ``ApiRequestException``
+            ``ApiRequestResponseException``
+        """
+        product_ids = get_product_ids(product_ids)
+        chunks = [product_ids[i:i + chunk_size] for i in range(0, len(product_ids), chunk_size)]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def get_chunk(chunk):
+            async with semaphore:
+                try:
+                    return await self._run_async(self.get_products_details, chunk, fields, country)
+                except ProductsNotFoudException:
+                    return []
+
+        results = await asyncio.gather(*(get_chunk(chunk) for chunk in chunks))
+        products = [product for result in results for product in result]
+
+        if products:
+            return products
+        else:
+            raise ProductsNotFoudException('No products found with current parameters')
+
+
+    def get_products_details_batched(self,
+        product_ids: Union[str, List[str]],
+        fields: Union[str, List[str]] = None,
+        country: str = None,
+        chunk_size: int = 50,
+        max_concurrency: int = 8,
+        **kwargs) -> List[models.Product]:
+        """Synchronous version of ``aget_products_details_batched``. Can't be called from a
+        running event loop.
+        """
+        return asyncio.run(self.aget_products_details_batched(
+            product_ids, fields, country, chunk_size, max_concurrency))
+
+
     def get_affiliate_links(self,
         links: Union[str, List[str]],
         link_type: models.LinkType = models.LinkType.NORMAL,
@@ -116,12 +215,13 @@ class AliexpressApi:
         links = get_list_as_string(links)
 
         request = aliapi.rest.AliexpressAffiliateLinkGenerateRequest()
+        request.set_app_info(self._app_info)
         request.app_signature = self._app_signature
         request.source_values = links
         request.promotion_link_type = link_type
         request.tracking_id = self._tracking_id
 
-        response = api_request(request, 'aliexpress_affiliate_link_generate_response')
+        response = api_request(request, 'aliexpress_affiliate_link_generate_response', self._pool)
 
         if response.total_result_count > 0:
             return response.promotion_links.promotion_link
@@ -141,6 +241,8 @@ class AliexpressApi:
 		platform_product_type: models.ProductType = None,
 		ship_to_country: str = None,
 		sort: models.SortBy = None,
+		materialize: bool = True,
+		raw: bool = False,
         **kwargs) -> models.HotProductsResponse:
         """Search for affiliated products with high commission.
 
@@ -159,6 +261,10 @@ class AliexpressApi:
             ship_to_country (``str``): Filter products that can be sent to that country.
                 Returns the price according to the country's tax rate policy.
             sort (``models.SortBy``): Specifies the sort method.
+            materialize (``bool``): If False, ``products`` is a generator that parses each
+                product when consumed, useful to stop early. Defaults to True.
+            raw (``bool``): If True, products are returned as received from the API, without
+                parsing them. Defaults to False.
 
         Returns:
             ``models.HotProductsResponse``: Contains response information and the list of products.
@@ -169,9 +275,10 @@ class AliexpressApi:
             ``ApiRequestResponseException``
         """
         request = aliapi.rest.AliexpressAffiliateHotproductQueryRequest()
+        request.set_app_info(self._app_info)
         request.app_signature = self._app_signature
         request.category_ids = get_list_as_string(category_ids)
-        request.delivery_days = str(delivery_days)
+        request.delivery_days = get_delivery_days_as_string(delivery_days)
         request.fields = get_list_as_string(fields)
         request.keywords = keywords
         request.max_sale_price = max_sale_price
@@ -185,10 +292,27 @@ class AliexpressApi:
         request.target_language = self._language
         request.tracking_id = self._tracking_id
 
-        response = api_request(request, 'aliexpress_affiliate_hotproduct_query_response')
+        use_cache = self._response_cache and materialize and not raw
+        if use_cache:
+            cache_key = get_request_cache_key(request)
+            response = self._response_cache.get(cache_key)
+            if response:
+                return copy.deepcopy(response)
+
+        response = api_request(request, 'aliexpress_affiliate_hotproduct_query_response', self._pool)
 
         if response.current_record_count > 0:
+            if raw:
+                response.products = response.products.product
+                return response
+
+            if not materialize:
+                response.products = iter_products(response.products.product)
+                return response
+
             response.products = parse_products(response.products.product)
+            if use_cache:
+                self._response_cache.set(cache_key, copy.deepcopy(response))
             return response
         else:
             raise ProductsNotFoudException('No products found with current parameters')
@@ -206,6 +330,8 @@ class AliexpressApi:
 		platform_product_type: models.ProductType = None,
 		ship_to_country: str = None,
 		sort: models.SortBy = None,
+		materialize: bool = True,
+		raw: bool = False,
         **kwargs) -> models.ProductsResponse:
         """Search for affiliated products.
 
@@ -224,6 +350,10 @@ class AliexpressApi:
             ship_to_country (``str``): Filter products that can be sent to that country.
                 Returns the price according to the country's tax rate policy.
             sort (``models.SortBy``): Specifies the sort method.
+            materialize (``bool``): If False, ``products`` is a generator that parses each
+                product when consumed, useful to stop early. Defaults to True.
+            raw (``bool``): If True, products are returned as received from the API, without
+                parsing them. Defaults to False.
 
         Returns:
             ``models.ProductsResponse``: Contains response information and the list of products.
@@ -234,9 +364,10 @@ class AliexpressApi:
             ``ApiRequestResponseException``
         """
         request = aliapi.rest.AliexpressAffiliateProductQueryRequest()
+        request.set_app_info(self._app_info)
         request.app_signature = self._app_signature
         request.category_ids = get_list_as_string(category_ids)
-        request.delivery_days = str(delivery_days)
+        request.delivery_days = get_delivery_days_as_string(delivery_days)
         request.fields = get_list_as_string(fields)
         request.keywords = keywords
         request.max_sale_price = max_sale_price
@@ -250,10 +381,15 @@ class AliexpressApi:
         request.target_language = self._language
         request.tracking_id = self._tracking_id
 
-        response = api_request(request, 'aliexpress_affiliate_product_query_response')
+        response = api_request(request, 'aliexpress_affiliate_product_query_response', self._pool)
 
         if response.current_record_count > 0:
-            response.products = parse_products(response.products.product)
+            if raw:
+                response.products = response.products.product
+            elif materialize:
+                response.products = parse_products(response.products.product)
+            else:
+                response.products = iter_products(response.products.product)
             return response
         else:
             raise ProductsNotFoudException('No products found with current parameters')
@@ -270,18 +406,55 @@ class AliexpressApi:
             ``ApiRequestException``
             ``ApiRequestResponseException``
         """
+        categories = self._fetch_categories()
+        self._set_categories(categories)
+        return categories
+
+
+    def _fetch_categories(self):
         request = aliapi.rest.AliexpressAffiliateCategoryGetRequest()
+        request.set_app_info(self._app_info)
         request.app_signature = self._app_signature
 
-        response = api_request(request, 'aliexpress_affiliate_category_get_response')
+        if self._response_cache:
+            cache_key = get_request_cache_key(request)
+            categories = self._response_cache.get(cache_key)
+            if categories:
+                return copy.deepcopy(categories)
+
+        response = api_request(request, 'aliexpress_affiliate_category_get_response', self._pool)
 
         if response.total_result_count > 0:
-            self.categories = response.categories.category
-            return self.categories
+            categories = response.categories.category
+            if self._response_cache:
+                self._response_cache.set(cache_key, copy.deepcopy(categories))
+            return categories
         else:
             raise CategoriesNotFoudException('No categories found')
 
 
+    def _set_categories(self, categories):
+        self._categories_index = (categories,) + index_categories(categories)
+        self.categories = categories
+
+
+    def _load_categories(self, use_cache):
+        """Returns the stored categories indexed by parent, requesting them only once even
+        if called from several threads at the same time."""
+        categories = self.categories
+        if not use_cache or not categories:
+            with self._categories_lock:
+                if not use_cache or not self.categories:
+                    self.get_categories()
+                categories = self.categories
+
+        index = self._categories_index
+        if index is None or index[0] is not categories:
+            index = (categories,) + index_categories(categories)
+            self._categories_index = index
+        return index
+
+
     def get_parent_categories(self, use_cache=True, **kwargs) -> List[models.Category]:
         """Get all available parent categories.
 
@@ -296,9 +469,8 @@ class AliexpressApi:
             ``ApiRequestException``
             ``ApiRequestResponseException``
         """
-        if not use_cache or not self.categories:
-            self.get_categories()
-        return filter_parent_categories(self.categories)
+        _, parent_categories, _ = self._load_categories(use_cache)
+        return list(parent_categories)
 
 
     def get_child_categories(self, parent_category_id: int, use_cache=True, **kwargs) -> List[models.ChildCategory]:
@@ -316,9 +488,8 @@ class AliexpressApi:
             ``ApiRequestException``
             ``ApiRequestResponseException``
         """
-        if not use_cache or not self.categories:
-            self.get_categories()
-        return filter_child_categories(self.categories, parent_category_id)
+        _, _, child_categories = self._load_categories(use_cache)
+        return list(child_categories.get(parent_category_id, []))
 
 
     def smart_match_product(self,
@@ -335,6 +506,7 @@ class AliexpressApi:
             target_language: str = None,
             tracking_id: str = None,
             user: str = None,
+            raw: bool = False,
             **kwargs) -> models.HotProductsResponse:
         """
         Get affiliated products using smart match based on keyword and device information.
@@ -352,6 +524,8 @@ class AliexpressApi:
             target_language (``str``): Language code for results (default is ES).
             tracking_id (``str``): Affiliate tracking ID for results.
             user (``str``): User identifier for additional targeting (optional).
+            raw (``bool``): If True, products are returned as received from the API, without
+                parsing them. Defaults to False.
 
         Returns:
             ``models.ProductSmartmatchResponse``: Contains response information and the list of products.
@@ -362,6 +536,7 @@ class AliexpressApi:
             ``ApiRequestResponseException``
         """
         request = aliapi.rest.AliexpressAffiliateProductSmartmatchRequest()
+        request.set_app_info(self._app_info)
         request.app = app,
         request.app_signature = self._app_signature
         request.country = country
@@ -377,10 +552,13 @@ class AliexpressApi:
         request.tracking_id = tracking_id
         request.user = user
 
-        response = api_request(request, 'aliexpress_affiliate_product_smartmatch_response')
+        response = api_request(request, 'aliexpress_affiliate_product_smartmatch_response', self._pool)
 
         if hasattr(response, 'products') and response.products:
-            response.products = parse_products(response.products.product)
+            if raw:
+                response.products = response.products.product
+            else:
+                response.products = parse_products(response.products.product)
             return response
         else:
             raise ProductsNotFoudException('No products found with current parameters')
@@ -414,16 +592,17 @@ class AliexpressApi:
             ApiRequestException: If the API request fails.
         """
         request = aliapi.rest.AliexpressAffiliateOrderListRequest()
+        request.set_app_info(self._app_info)
         request.app_signature = self._app_signature
         request.start_time = start_time
         request.end_time = end_time
-        request.fields = ','.join(fields) if isinstance(fields, list) else fields
+        request.fields = get_list_as_string(fields)
         request.locale_site = locale_site
         request.page_no = page_no
         request.page_size = page_size
         request.status = status
 
-        response = api_request(request, 'aliexpress_affiliate_order_list_response')
+        response = api_request(request, 'aliexpress_affiliate_order_list_response', self._pool)
 
         if response.current_record_count > 0:
             return response
@@ -431,3 +610,104 @@ class AliexpressApi:
             raise OrdersNotFoundException("No orders found for the specified parameters")
 
 
+    def iter_order_list(self,
+                        status: str,
+                        start_time: str,
+                        end_time: str,
+                        fields: Union[str, List[str]] = None,
+                        locale_site: str = None,
+                        page_size: int = None,
+                        max_concurrency: int = 8,
+                        **kwargs) -> Iterator[models.Order]:
+        """
+        Iterate over all the affiliate orders. The first page tells how many pages there are,
+        and the rest of them are requested concurrently. Orders are yielded in page order.
+
+        Args:
+            start_time (str): Start time in format 'YYYY-MM-DD HH:MM:SS'.
+            end_time (str): End time in format 'YYYY-MM-DD HH:MM:SS'.
+            fields (str | list[str]): The fields to include in the results list.
+            locale_site (str): Locale site, such as 'ru_site' for the Russian site.
+            page_size (int): Number of records per page, up to 50.
+            status (str): Status filter for the orders, e.g., 'Payment Completed'.
+            max_concurrency (int): Maximum number of pages requested at the same time.
+
+        Yields:
+            Order: Each order in the specified period.
+
+        Raises:
+            OrdersNotFoundException: If no orders are found for the specified parameters.
+            ApiRequestException: If the API request fails.
+        """
+        def get_page_orders(page_no):
+            try:
+                response = self.get_order_list(status, start_time, end_time, fields,
+                                               locale_site, page_no, page_size)
+            except OrdersNotFoundException:
+                return []
+            return response.orders.order
+
+        response = self.get_order_list(status, start_time, end_time, fields,
+                                       locale_site, 1, page_size)
+        yield from response.orders.order
+
+        total_pages = getattr(response, 'total_page_no', None)
+        if not total_pages:
+            total_pages = math.ceil(response.total_record_count / response.current_record_count)
+
+        if total_pages > 1:
+            with ThreadPoolExecutor(max_concurrency) as executor:
+                for orders in executor.map(get_page_orders, range(2, total_pages + 1)):
+                    yield from orders
+
+
+    async def _run_async(self, method, *args, **kwargs):
+        """Runs a blocking API method in the event loop default executor. All of them share
+        the instance connection pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(method, *args, **kwargs))
+
+
+    async def aget_products_details(self, *args, **kwargs) -> List[models.Product]:
+        """Asynchronous version of ``get_products_details``, accepting the same arguments."""
+        return await self._run_async(self.get_products_details, *args, **kwargs)
+
+
+    async def aget_affiliate_links(self, *args, **kwargs) -> List[models.AffiliateLink]:
+        """Asynchronous version of ``get_affiliate_links``, accepting the same arguments."""
+        return await self._run_async(self.get_affiliate_links, *args, **kwargs)
+
+
+    async def aget_hotproducts(self, *args, **kwargs) -> models.HotProductsResponse:
+        """Asynchronous version of ``get_hotproducts``, accepting the same arguments."""
+        return await self._run_async(self.get_hotproducts, *args, **kwargs)
+
+
+    async def aget_products(self, *args, **kwargs) -> models.ProductsResponse:
+        """Asynchronous version of ``get_products``, accepting the same arguments."""
+        return await self._run_async(self.get_products, *args, **kwargs)
+
+
+    async def aget_categories(self, *args, **kwargs) -> List[Union[models.Category, ChildCategory]]:
+        """Asynchronous version of ``get_categories``, accepting the same arguments."""
+        return await self._run_async(self.get_categories, *args, **kwargs)
+
+
+    async def aget_parent_categories(self, *args, **kwargs) -> List[models.Category]:
+        """Asynchronous version of ``get_parent_categories``, accepting the same arguments."""
+        return await self._run_async(self.get_parent_categories, *args, **kwargs)
+
+
+    async def aget_child_categories(self, *args, **kwargs) -> List[models.ChildCategory]:
+        """Asynchronous version of ``get_child_categories``, accepting the same arguments."""
+        return await self._run_async(self.get_child_categories, *args, **kwargs)
+
+
+    async def asmart_match_product(self, *args, **kwargs) -> models.HotProductsResponse:
+        """Asynchronous version of ``smart_match_product``, accepting the same arguments."""
+        return await self._run_async(self.smart_match_product, *args, **kwargs)
+
+
+    async def aget_order_list(self, *args, **kwargs) -> models.OrderListResponse:
+        """Asynchronous version of ``get_order_list``, accepting the same arguments."""
+        return await self._run_async(self.get_order_list, *args, **kwargs)
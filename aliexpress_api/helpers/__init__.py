@@ -1,4 +1,5 @@
 from .requests import api_request
-from .arguments import get_list_as_string, get_product_ids
-from .products import parse_products
-from .categories import filter_parent_categories, filter_child_categories
+from .arguments import get_list_as_string, get_product_ids, get_product_ids_as_string, get_delivery_days_as_string
+from .products import parse_products, iter_products, to_records
+from .cache import ResponseCache, get_request_cache_key
+from .categories import filter_parent_categories, filter_child_categories, index_categories
@@ -1,7 +1,14 @@
+from functools import lru_cache
+
 from ..tools.get_product_id import get_product_id
 from ..errors.exceptions import InvalidArgumentException
 
 
+_get_product_id = lru_cache(maxsize=1024)(get_product_id)
+
+_DELIVERY_DAYS = [str(days) for days in range(61)]
+
+
 def get_list_as_string(value):
     if value is None:
         return None
@@ -16,15 +23,31 @@ def get_list_as_string(value):
         raise InvalidArgumentException('Argument should be a list or string: ' + str(value))
 
 
-def get_product_ids(values):
+def _get_product_id_values(values):
     if isinstance(values, str):
-        values = values.split(',')
+        return values.split(',')
 
     elif not isinstance(values, list):
         raise InvalidArgumentException('Argument product_ids should be a list or string')
 
-    product_ids = []
-    for value in values:
-        product_ids.append(get_product_id(value))
+    return values
+
+
+def get_product_ids(values):
+    values = _get_product_id_values(values)
+    return list(map(_get_product_id, values))
+
+
+def get_product_ids_as_string(values):
+    values = _get_product_id_values(values)
+    return ','.join(map(_get_product_id, values))
+
+
+def get_delivery_days_as_string(value):
+    if value is None:
+        return None
+
+    if type(value) is int and 0 <= value < len(_DELIVERY_DAYS):
+        return _DELIVERY_DAYS[value]
 
-    return product_ids
+    return str(value)
@@ -0,0 +1,43 @@
+from collections import OrderedDict
+import threading
+import time
+
+
+class ResponseCache:
+    """Keeps parsed API responses in memory for a limited time."""
+
+    def __init__(self, ttl: float, maxsize: int = 512):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+
+            expires, value = item
+            if expires < time.monotonic():
+                del self._items[key]
+                return None
+
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl, value)
+            self._items.move_to_end(key)
+            if len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+def get_request_cache_key(request):
+    parameters = request.getApplicationParameters()
+    return request.getapiname(), tuple(sorted(parameters.items()))
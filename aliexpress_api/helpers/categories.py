@@ -21,3 +21,16 @@ def filter_child_categories(categories: List[Union[models.Category, models.Child
             filtered_categories.append(category)
 
     return filtered_categories
+
+
+def index_categories(categories: List[Union[models.Category, models.ChildCategory]]):
+    parent_categories = []
+    child_categories = {}
+
+    for category in categories:
+        if hasattr(category, 'parent_category_id'):
+            child_categories.setdefault(category.parent_category_id, []).append(category)
+        else:
+            parent_categories.append(category)
+
+    return parent_categories, child_categories
@@ -4,9 +4,21 @@ def parse_product(product):
 
 
 def parse_products(products):
-    new_products = []
+    """Parses the products in place, reusing the list received from the API."""
+    for product in products:
+        parse_product(product)
+
+    return products
+
 
+def iter_products(products):
+    """Parses each product when it is consumed."""
     for product in products:
-        new_products.append(parse_product(product))
+        yield parse_product(product)
 
-    return new_products
+
+def to_records(products, fields):
+    """Yields a tuple with the given fields of each product, None if missing. Useful to
+    build a table, e.g. ``pandas.DataFrame.from_records(to_records(products, fields), columns=fields)``."""
+    for product in products:
+        yield tuple(getattr(product, field, None) for field in fields)
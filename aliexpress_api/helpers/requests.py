@@ -1,21 +1,22 @@
 from types import SimpleNamespace
-import json
 
 from ..errors import ApiRequestException, ApiRequestResponseException
 
 
-def api_request(request, response_name):
+def _to_namespace(values):
+    return SimpleNamespace(**values)
+
+
+def api_request(request, response_name, pool=None):
     try:
-        response = request.getResponse()
+        response = request.getResponse(pool=pool, object_hook=_to_namespace)
     except Exception as error:
         if hasattr(error, 'message'):
             raise ApiRequestException(error.message) from error
         raise ApiRequestException(error) from error
 
     try:
-        response = response[response_name]['resp_result']
-        response = json.dumps(response)
-        response = json.loads(response, object_hook=lambda d: SimpleNamespace(**d))
+        response = getattr(response, response_name).resp_result
     except Exception as error:
         raise ApiRequestResponseException(error) from error
 
@@ -3,7 +3,7 @@ Created on 2012-6-29
 
 @author: lihao
 '''
-from .api.base import sign
+from .api.base import sign, sign_prototype
 
 
 
@@ -11,6 +11,7 @@ class appinfo(object):
     def __init__(self,appkey,secret):
         self.appkey = appkey
         self.secret = secret
+        self.sign_prototype = sign_prototype(secret)
 
 def getDefaultAppInfo():
     pass
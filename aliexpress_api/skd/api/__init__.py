@@ -1,2 +1,2 @@
 from .rest import *
-from .base import FileItem
+from .base import FileItem, ConnectionPool
@@ -11,6 +11,7 @@ import http.client as httplib
 import itertools
 import json
 import mimetypes
+import threading
 import time
 import urllib
 
@@ -40,11 +41,21 @@ P_SUB_MSG = "sub_msg"
 N_REST = "/sync"
 
 
-def sign(secret, parameters):
+def sign_prototype(secret):
+    # ===========================================================================
+    # '''预先计算以密钥开头的 md5 对象, 签名时 copy() 复用
+    # @param secret: 签名需要的密钥
+    # '''
+    # ===========================================================================
+    return hashlib.md5(secret.encode("utf-8"))
+
+
+def sign(secret, parameters, prototype=None):
     # ===========================================================================
     # '''签名方法
     # @param secret: 签名需要的密钥
     # @param parameters: 支持字典和string两种
+    # @param prototype: 可选, sign_prototype(secret) 的结果
     # '''
     # ===========================================================================
     # 如果parameters 是字典类的话
@@ -53,6 +64,16 @@ def sign(secret, parameters):
         keys = list(keys)
         keys.sort()
 
+        if prototype is not None:
+            md5 = prototype.copy()
+            md5.update(
+                str()
+                .join("%s%s" % (key, parameters[key]) for key in keys)
+                .encode("utf-8")
+            )
+            md5.update(secret.encode("utf-8"))
+            return md5.hexdigest().upper()
+
         parameters = "%s%s%s" % (
             secret,
             str().join("%s%s" % (key, parameters[key]) for key in keys),
@@ -185,11 +206,68 @@ class RequestException(Exception):
     pass
 
 
+def _new_connection(domain, port, timeout):
+    if port == 443:
+        return httplib.HTTPSConnection(domain, port, timeout=timeout)
+    return httplib.HTTPConnection(domain, port, timeout=timeout)
+
+
+class ConnectionPool(object):
+    # ===========================================================================
+    # 连接池, 复用 Keep-Alive 连接以避免每次请求重新握手
+    # ===========================================================================
+
+    def __init__(self, maxsize=10):
+        self.maxsize = maxsize
+        self.__connections = {}
+        self.__lock = threading.Lock()
+
+    def acquire(self, domain, port, timeout):
+        # =======================================================================
+        # 获取一个连接, 返回 (connection, reused)
+        # =======================================================================
+        with self.__lock:
+            idle = self.__connections.get((domain, port))
+            if idle:
+                connection = idle.pop()
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection, True
+        return _new_connection(domain, port, timeout), False
+
+    def release(self, domain, port, connection):
+        with self.__lock:
+            idle = self.__connections.setdefault((domain, port), [])
+            if len(idle) < self.maxsize:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def close(self):
+        with self.__lock:
+            connections = self.__connections
+            self.__connections = {}
+        for idle in connections.values():
+            for connection in idle:
+                connection.close()
+
+
 class RestApi(object):
     # ===========================================================================
     # Rest api的基类
     # ===========================================================================
 
+    # 子类在 __slots__ 中声明请求参数, 避免每个请求对象创建 __dict__
+    __slots__ = (
+        "__domain",
+        "__port",
+        "__httpmethod",
+        "__app_key",
+        "__secret",
+        "__sign_prototype",
+    )
+
     def __init__(self, domain="api-sg.aliexpress.com", port=80):
         # =======================================================================
         # 初始化基类
@@ -199,11 +277,11 @@ class RestApi(object):
         self.__domain = domain
         self.__port = port
         self.__httpmethod = "POST"
+        self.__sign_prototype = None
         from .. import getDefaultAppInfo
 
         if getDefaultAppInfo():
-            self.__app_key = getDefaultAppInfo().appkey
-            self.__secret = getDefaultAppInfo().secret
+            self.set_app_info(getDefaultAppInfo())
 
     def get_request_header(self):
         return {
@@ -220,6 +298,7 @@ class RestApi(object):
         # =======================================================================
         self.__app_key = appinfo.appkey
         self.__secret = appinfo.secret
+        self.__sign_prototype = getattr(appinfo, "sign_prototype", None)
 
     def getapiname(self):
         return ""
@@ -233,18 +312,12 @@ class RestApi(object):
     def _check_requst(self):
         pass
 
-    def getResponse(self, authrize=None, timeout=30):
+    def getResponse(self, authrize=None, timeout=30, pool=None, object_hook=None):
         # =======================================================================
         # 获取response结果
+        # @param pool: 可选的 ConnectionPool, 用于复用连接
+        # @param object_hook: 可选, 传给 json.loads, 在解析时直接构造结果对象
         # =======================================================================
-        if self.__port == 443:
-            connection = httplib.HTTPSConnection(
-                self.__domain, self.__port, timeout=timeout
-            )
-        else:
-            connection = httplib.HTTPConnection(
-                self.__domain, self.__port, timeout=timeout
-            )
         timestamp_temp = "%.2f" % (float(time.time()))
         timestamp_temp = str(int(float(timestamp_temp) * 1000))
 
@@ -262,8 +335,9 @@ class RestApi(object):
         application_parameter = self.getApplicationParameters()
         sign_parameter = sys_parameters.copy()
         sign_parameter.update(application_parameter)
-        sys_parameters[P_SIGN] = sign(self.__secret, sign_parameter)
-        connection.connect()
+        sys_parameters[P_SIGN] = sign(
+            self.__secret, sign_parameter, self.__sign_prototype
+        )
 
         header = self.get_request_header()
         if self.getMultipartParas():
@@ -280,39 +354,100 @@ class RestApi(object):
             body = urllib.parse.urlencode(application_parameter)
 
         url = N_REST + "?" + urllib.parse.urlencode(sys_parameters)
-        connection.request(self.__httpmethod, url, body=body, headers=header)
-        response = connection.getresponse()
+
+        if pool is None:
+            connection = _new_connection(self.__domain, self.__port, timeout)
+            connection.connect()
+            response, result = self.__send(connection, url, body, header)
+        else:
+            response, result = self.__send_pooled(pool, timeout, url, body, header)
+
         if response.status != 200:
             raise RequestException(
                 "invalid http status "
                 + str(response.status)
                 + ",detail body:"
-                + response.read()
+                + result.decode("utf-8", "replace")
             )
-        result = response.read()
-        jsonobj = json.loads(result)
-        if "error_response" in jsonobj:
+        jsonobj = json.loads(result, object_hook=object_hook)
+        if isinstance(jsonobj, dict):
+            error_response = jsonobj.get("error_response")
+        else:
+            error_response = getattr(jsonobj, "error_response", None)
+        if error_response is not None:
+            if not isinstance(error_response, dict):
+                error_response = vars(error_response)
             error = TopException()
-            if P_CODE in jsonobj["error_response"]:
-                error.errorcode = jsonobj["error_response"][P_CODE]
-            if P_MSG in jsonobj["error_response"]:
-                error.message = jsonobj["error_response"][P_MSG]
-            if P_SUB_CODE in jsonobj["error_response"]:
-                error.subcode = jsonobj["error_response"][P_SUB_CODE]
-            if P_SUB_MSG in jsonobj["error_response"]:
-                error.submsg = jsonobj["error_response"][P_SUB_MSG]
+            if P_CODE in error_response:
+                error.errorcode = error_response[P_CODE]
+            if P_MSG in error_response:
+                error.message = error_response[P_MSG]
+            if P_SUB_CODE in error_response:
+                error.subcode = error_response[P_SUB_CODE]
+            if P_SUB_MSG in error_response:
+                error.submsg = error_response[P_SUB_MSG]
             error.application_host = response.getheader("Application-Host", "")
             error.service_host = response.getheader("Location-Host", "")
             raise error
         return jsonobj
 
+    def __send(self, connection, url, body, header):
+        connection.request(self.__httpmethod, url, body=body, headers=header)
+        response = connection.getresponse()
+        return response, response.read()
+
+    def __send_pooled(self, pool, timeout, url, body, header):
+        connection, reused = pool.acquire(self.__domain, self.__port, timeout)
+        try:
+            try:
+                response, result = self.__send(connection, url, body, header)
+            except (httplib.HTTPException, ConnectionError):
+                # 空闲连接可能已被服务端关闭, 重新建立连接后重试一次
+                if not reused:
+                    raise
+                connection.close()
+                connection = _new_connection(self.__domain, self.__port, timeout)
+                response, result = self.__send(connection, url, body, header)
+        except Exception:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            pool.release(self.__domain, self.__port, connection)
+        return response, result
+
+    @classmethod
+    def getParameterNames(cls):
+        # =======================================================================
+        # 子类 __slots__ 中声明的请求参数名, 每个类只计算一次
+        # =======================================================================
+        names = cls.__dict__.get("_parameter_names")
+        if names is None:
+            names = []
+            for klass in reversed(cls.__mro__):
+                if klass is RestApi:
+                    continue
+                slots = klass.__dict__.get("__slots__", ())
+                names.extend((slots,) if isinstance(slots, str) else slots)
+            names = tuple(names)
+            cls._parameter_names = names
+        return names
+
     def getApplicationParameters(self):
         application_parameter = {}
-        for key in self.__dict__:
+        multipart_parameters = self.getMultipartParas()
+        for key in self.getParameterNames():
+            value = getattr(self, key, None)
+            if value is not None and not key in multipart_parameters:
+                application_parameter[key] = value
+        # 兼容未声明 __slots__ 的子类
+        for key in getattr(self, "__dict__", {}):
             value = self.__dict__[key]
             if (
                 not key.startswith("__")
-                and not key in self.getMultipartParas()
+                and not key in multipart_parameters
                 and not key.startswith("_RestApi__")
                 and value is not None
             ):
@@ -5,6 +5,8 @@ from ..base import RestApi
 
 
 class AliexpressAffiliateCategoryGetRequest(RestApi):
+    __slots__ = ("app_signature",)
+
     def __init__(self, domain="api-sg.aliexpress.com", port=80):
         RestApi.__init__(self, domain, port)
         self.app_signature = None
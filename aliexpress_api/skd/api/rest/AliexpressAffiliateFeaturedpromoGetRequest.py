@@ -5,6 +5,11 @@ from ..base import RestApi
 
 
 class AliexpressAffiliateFeaturedpromoGetRequest(RestApi):
+    __slots__ = (
+        "app_signature",
+        "fields",
+    )
+
     def __init__(self, domain="api-sg.aliexpress.com", port=80):
         RestApi.__init__(self, domain, port)
         self.app_signature = None
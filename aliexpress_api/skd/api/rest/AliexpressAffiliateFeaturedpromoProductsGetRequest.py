@@ -5,6 +5,22 @@ from ..base import RestApi
 
 
 class AliexpressAffiliateFeaturedpromoProductsGetRequest(RestApi):
+    __slots__ = (
+        "app_signature",
+        "category_id",
+        "country",
+        "fields",
+        "page_no",
+        "page_size",
+        "promotion_end_time",
+        "promotion_name",
+        "promotion_start_time",
+        "sort",
+        "target_currency",
+        "target_language",
+        "tracking_id",
+    )
+
     def __init__(self, domain="api-sg.aliexpress.com", port=80):
         RestApi.__init__(self, domain, port)
         self.app_signature = None
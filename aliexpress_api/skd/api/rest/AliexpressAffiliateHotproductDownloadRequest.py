@@ -5,6 +5,19 @@ from ..base import RestApi
 
 
 class AliexpressAffiliateHotproductDownloadRequest(RestApi):
+    __slots__ = (
+        "app_signature",
+        "category_id",
+        "country",
+        "fields",
+        "locale_site",
+        "page_no",
+        "page_size",
+        "target_currency",
+        "target_language",
+        "tracking_id",
+    )
+
     def __init__(self, domain="api-sg.aliexpress.com", port=80):
         RestApi.__init__(self, domain, port)
         self.app_signature = None
@@ -5,6 +5,13 @@ from ..base import RestApi
 
 
 class AliexpressAffiliateLinkGenerateRequest(RestApi):
+    __slots__ = (
+        "app_signature",
+        "promotion_link_type",
+        "source_values",
+        "tracking_id",
+    )
+
     def __init__(self, domain="api-sg.aliexpress.com", port=80):
         RestApi.__init__(self, domain, port)
         self.app_signature = None
@@ -5,6 +5,12 @@ from ..base import RestApi
 
 
 class AliexpressAffiliateOrderGetRequest(RestApi):
+    __slots__ = (
+        "app_signature",
+        "fields",
+        "order_ids",
+    )
+
     def __init__(self, domain="api-sg.aliexpress.com", port=80):
         RestApi.__init__(self, domain, port)
         self.app_signature = None
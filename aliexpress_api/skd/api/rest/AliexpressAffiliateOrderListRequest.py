@@ -5,6 +5,17 @@ from ..base import RestApi
 
 
 class AliexpressAffiliateOrderListRequest(RestApi):
+    __slots__ = (
+        "app_signature",
+        "end_time",
+        "fields",
+        "locale_site",
+        "page_no",
+        "page_size",
+        "start_time",
+        "status",
+    )
+
     def __init__(self, domain="api-sg.aliexpress.com", port=80):
         RestApi.__init__(self, domain, port)
         self.app_signature = None
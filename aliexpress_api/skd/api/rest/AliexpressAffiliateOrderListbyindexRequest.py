@@ -5,6 +5,16 @@ from ..base import RestApi
 
 
 class AliexpressAffiliateOrderListbyindexRequest(RestApi):
+    __slots__ = (
+        "app_signature",
+        "end_time",
+        "fields",
+        "page_size",
+        "start_query_index_id",
+        "start_time",
+        "status",
+    )
+
     def __init__(self, domain="api-sg.aliexpress.com", port=80):
         RestApi.__init__(self, domain, port)
         self.app_signature = None
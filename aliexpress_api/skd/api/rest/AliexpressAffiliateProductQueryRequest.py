@@ -5,6 +5,24 @@ from ..base import RestApi
 
 
 class AliexpressAffiliateProductQueryRequest(RestApi):
+    __slots__ = (
+        "app_signature",
+        "category_ids",
+        "delivery_days",
+        "fields",
+        "keywords",
+        "max_sale_price",
+        "min_sale_price",
+        "page_no",
+        "page_size",
+        "platform_product_type",
+        "ship_to_country",
+        "sort",
+        "target_currency",
+        "target_language",
+        "tracking_id",
+    )
+
     def __init__(self, domain="api-sg.aliexpress.com", port=80):
         RestApi.__init__(self, domain, port)
         self.app_signature = None
@@ -5,6 +5,23 @@ from ..base import RestApi
 
 
 class AliexpressAffiliateProductSmartmatchRequest(RestApi):
+    __slots__ = (
+        "app",
+        "app_signature",
+        "country",
+        "device",
+        "device_id",
+        "fields",
+        "keywords",
+        "page_no",
+        "product_id",
+        "site",
+        "target_currency",
+        "target_language",
+        "tracking_id",
+        "user",
+    )
+
     def __init__(self, domain="api-sg.aliexpress.com", port=80):
         RestApi.__init__(self, domain, port)
         self.app = None
@@ -5,6 +5,16 @@ from ..base import RestApi
 
 
 class AliexpressAffiliateProductdetailGetRequest(RestApi):
+    __slots__ = (
+        "app_signature",
+        "country",
+        "fields",
+        "product_ids",
+        "target_currency",
+        "target_language",
+        "tracking_id",
+    )
+
     def __init__(self, domain="api-sg.aliexpress.com", port=80):
         RestApi.__init__(self, domain, port)
         self.app_signature = None
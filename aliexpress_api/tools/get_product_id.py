@@ -4,14 +4,18 @@ from ..errors import ProductIdNotFoundException
 import re
 
 
+PRODUCT_ID_PATTERN = re.compile(r'^[0-9]*$', re.ASCII)
+URL_PRODUCT_ID_PATTERN = re.compile(r'(\/)([0-9]*)(\.)', re.ASCII)
+
+
 def get_product_id(text: str) -> str:
     """Returns the product ID from a given text. Raises ProductIdNotFoundException on fail."""
     # Return if text is a product ID
-    if re.search(r'^[0-9]*$', text):
+    if PRODUCT_ID_PATTERN.search(text):
         return text
 
     # Extract product ID from URL
-    asin = re.search(r'(\/)([0-9]*)(\.)', text)
+    asin = URL_PRODUCT_ID_PATTERN.search(text)
     if asin:
         return asin.group(2)
     else: